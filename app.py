@@ -3,13 +3,15 @@ from __future__ import annotations
 import json
 import math
 from datetime import date
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 
 SCENARIOS = ("Low", "Base", "High")
 CONFIDENCE_SCORES = {
@@ -18,6 +20,18 @@ CONFIDENCE_SCORES = {
     "Analyst assumption": 0.45,
     "Speculative": 0.2,
 }
+DRIVER_COLUMNS = [
+    "Driver",
+    "Type",
+    "Source ID",
+    "Confidence",
+    "Notes",
+    "Low current ($m)",
+    "Base current ($m)",
+    "High current ($m)",
+    "Confidence score",
+    "Sensitivity spread ($m)",
+]
 
 
 def default_events() -> pd.DataFrame:
@@ -293,98 +307,132 @@ def pct(value: float) -> str:
     return f"{value:.1f}%"
 
 
-def event_model(events: pd.DataFrame) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for _, row in events.iterrows():
-        output = {
-            "Driver": str(row.get("Event", "")),
-            "Type": "Liquidity event",
-            "Source ID": row.get("Source ID", ""),
-            "Confidence": row.get("Confidence", "Analyst assumption"),
-            "Notes": row.get("Notes", ""),
-        }
-        deal_value = safe_number(row.get("Deal value ($m)"))
-        for scenario in SCENARIOS:
-            ownership = safe_number(row.get(f"{scenario} ownership %")) / 100
-            keep = safe_number(row.get(f"{scenario} keep %")) / 100
-            multiple = safe_number(row.get(f"{scenario} return multiple"), 1)
-            gross = deal_value * ownership
-            current = gross * keep * multiple
-            output[f"{scenario} gross ($m)"] = gross
-            output[f"{scenario} current ($m)"] = current
-        rows.append(output)
-    return pd.DataFrame(rows)
+def numeric_column(
+    frame: pd.DataFrame, column: str, default: float = 0.0
+) -> np.ndarray:
+    if column not in frame:
+        return np.full(len(frame), default)
+    values = pd.to_numeric(frame[column], errors="coerce")
+    return values.fillna(default).to_numpy(dtype=float)
 
 
-def compound_stream(row: pd.Series, scenario: str, valuation_year: int) -> float:
+def scenario_matrix(
+    frame: pd.DataFrame, template: str, default: float = 0.0
+) -> np.ndarray:
+    return np.column_stack(
+        [
+            numeric_column(frame, template.format(scenario=scenario), default)
+            for scenario in SCENARIOS
+        ]
+    )
+
+
+def column_values(frame: pd.DataFrame, column: str, default: Any) -> np.ndarray:
+    if column not in frame:
+        return np.full(len(frame), default, dtype=object)
+    return frame[column].to_numpy(dtype=object)
+
+
+def driver_columns(
+    frame: pd.DataFrame, name_column: str, driver_type: str
+) -> dict[str, Any]:
+    return {
+        "Driver": [str(value) for value in column_values(frame, name_column, "")],
+        "Type": driver_type,
+        "Source ID": column_values(frame, "Source ID", ""),
+        "Confidence": column_values(frame, "Confidence", "Analyst assumption"),
+        "Notes": column_values(frame, "Notes", ""),
+    }
+
+
+def event_model(events: pd.DataFrame) -> pd.DataFrame:
+    if events.empty:
+        return pd.DataFrame()
+    deal_value = numeric_column(events, "Deal value ($m)")[:, np.newaxis]
+    ownership = scenario_matrix(events, "{scenario} ownership %") / 100
+    keep = scenario_matrix(events, "{scenario} keep %") / 100
+    multiple = scenario_matrix(events, "{scenario} return multiple", 1)
+    gross = deal_value * ownership
+    current = gross * keep * multiple
+
+    output = driver_columns(events, "Event", "Liquidity event")
+    for index, scenario in enumerate(SCENARIOS):
+        output[f"{scenario} gross ($m)"] = gross[:, index]
+        output[f"{scenario} current ($m)"] = current[:, index]
+    return pd.DataFrame(output)
+
+
+def stream_window(row: pd.Series, valuation_year: int) -> tuple[int, int]:
     start_year = int(safe_number(row.get("Start year"), valuation_year))
     end_year = int(safe_number(row.get("End year"), start_year))
-    end_year = min(end_year, valuation_year)
-    if end_year < start_year:
-        return 0.0
+    return start_year, min(end_year, valuation_year)
 
+
+def stream_inputs(row: pd.Series, scenario: str) -> tuple[float, float, float]:
     annual_gross = safe_number(row.get(f"{scenario} annual gross ($m)"))
     investable = safe_number(row.get(f"{scenario} investable %")) / 100
     cagr = safe_number(row.get(f"{scenario} CAGR %")) / 100
+    return annual_gross, investable, cagr
+
+
+def compounded_contributions(
+    annual_gross: float | np.ndarray,
+    investable: float | np.ndarray,
+    cagr: float | np.ndarray,
+    start_year: int,
+    end_year: int,
+    valuation_year: int,
+) -> np.ndarray:
+    cagr = np.asarray(cagr, dtype=float)
+    if end_year < start_year:
+        return np.zeros(cagr.shape)
+    years_compounded = valuation_year - np.arange(start_year, end_year + 1)
+    growth = np.power(1 + cagr[..., np.newaxis], years_compounded)
+    return annual_gross * investable * growth.sum(axis=-1)
 
-    total = 0.0
-    for year in range(start_year, end_year + 1):
-        years_compounded = max(0, valuation_year - year)
-        total += annual_gross * investable * ((1 + cagr) ** years_compounded)
-    return total
+
+def compound_stream(row: pd.Series, scenario: str, valuation_year: int) -> float:
+    start_year, end_year = stream_window(row, valuation_year)
+    return float(
+        compounded_contributions(
+            *stream_inputs(row, scenario), start_year, end_year, valuation_year
+        )
+    )
 
 
 def comp_model(comp_streams: pd.DataFrame, valuation_year: int) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for _, row in comp_streams.iterrows():
-        output = {
-            "Driver": str(row.get("Stream", "")),
-            "Type": "Comp stream",
-            "Source ID": row.get("Source ID", ""),
-            "Confidence": row.get("Confidence", "Analyst assumption"),
-            "Notes": row.get("Notes", ""),
-        }
-        for scenario in SCENARIOS:
-            output[f"{scenario} current ($m)"] = compound_stream(
-                row, scenario, valuation_year
-            )
-        rows.append(output)
-    return pd.DataFrame(rows)
+    if comp_streams.empty:
+        return pd.DataFrame()
+    current = np.empty((len(comp_streams), len(SCENARIOS)))
+    for index, (_, row) in enumerate(comp_streams.iterrows()):
+        start_year, end_year = stream_window(row, valuation_year)
+        annual_gross, investable, cagr = np.array(
+            [stream_inputs(row, scenario) for scenario in SCENARIOS]
+        ).T
+        current[index] = compounded_contributions(
+            annual_gross, investable, cagr, start_year, end_year, valuation_year
+        )
+
+    output = driver_columns(comp_streams, "Stream", "Comp stream")
+    for index, scenario in enumerate(SCENARIOS):
+        output[f"{scenario} current ($m)"] = current[:, index]
+    return pd.DataFrame(output)
 
 
 def asset_model(assets: pd.DataFrame) -> pd.DataFrame:
-    rows: list[dict[str, Any]] = []
-    for _, row in assets.iterrows():
-        output = {
-            "Driver": str(row.get("Item", "")),
-            "Type": "Current asset / liability",
-            "Source ID": row.get("Source ID", ""),
-            "Confidence": row.get("Confidence", "Analyst assumption"),
-            "Notes": row.get("Notes", ""),
-        }
-        for scenario in SCENARIOS:
-            output[f"{scenario} current ($m)"] = safe_number(
-                row.get(f"{scenario} value ($m)")
-            )
-        rows.append(output)
-    return pd.DataFrame(rows)
+    if assets.empty:
+        return pd.DataFrame()
+    values = scenario_matrix(assets, "{scenario} value ($m)")
+
+    output = driver_columns(assets, "Item", "Current asset / liability")
+    for index, scenario in enumerate(SCENARIOS):
+        output[f"{scenario} current ($m)"] = values[:, index]
+    return pd.DataFrame(output)
 
 
 def combine_drivers(
     events: pd.DataFrame, comp_streams: pd.DataFrame, assets: pd.DataFrame, valuation_year: int
 ) -> pd.DataFrame:
-    output_columns = [
-        "Driver",
-        "Type",
-        "Source ID",
-        "Confidence",
-        "Notes",
-        "Low current ($m)",
-        "Base current ($m)",
-        "High current ($m)",
-        "Confidence score",
-        "Sensitivity spread ($m)",
-    ]
     frames = [
         event_model(events),
         comp_model(comp_streams, valuation_year),
@@ -392,30 +440,31 @@ def combine_drivers(
     ]
     non_empty = [frame for frame in frames if not frame.empty]
     if not non_empty:
-        return pd.DataFrame(columns=output_columns)
+        return pd.DataFrame(columns=DRIVER_COLUMNS)
     result = pd.concat(non_empty, ignore_index=True)
     result["Confidence score"] = result["Confidence"].map(confidence_score)
     result["Sensitivity spread ($m)"] = (
         result["High current ($m)"] - result["Low current ($m)"]
     )
-    return result.reindex(columns=output_columns)
+    return result.reindex(columns=DRIVER_COLUMNS)
 
 
 def summarize(drivers: pd.DataFrame, haircuts: dict[str, float]) -> pd.DataFrame:
-    rows = []
-    for scenario in SCENARIOS:
-        gross = safe_number(drivers.get(f"{scenario} current ($m)", pd.Series()).sum())
-        haircut = haircuts[scenario] / 100
-        net = gross * (1 - haircut)
-        rows.append(
-            {
-                "Scenario": scenario,
-                "Gross wealth ($m)": gross,
-                "Global haircut %": haircuts[scenario],
-                "Estimated net worth ($m)": net,
-            }
-        )
-    return pd.DataFrame(rows)
+    gross = np.array(
+        [
+            safe_number(drivers.get(f"{scenario} current ($m)", pd.Series()).sum())
+            for scenario in SCENARIOS
+        ]
+    )
+    haircut = np.array([haircuts[scenario] for scenario in SCENARIOS])
+    return pd.DataFrame(
+        {
+            "Scenario": list(SCENARIOS),
+            "Gross wealth ($m)": gross,
+            "Global haircut %": haircut,
+            "Estimated net worth ($m)": gross * (1 - haircut / 100),
+        }
+    )
 
 
 def source_quality(drivers: pd.DataFrame) -> pd.DataFrame:
@@ -435,12 +484,9 @@ def source_quality(drivers: pd.DataFrame) -> pd.DataFrame:
 def threshold_analysis(
     summary: pd.DataFrame, drivers: pd.DataFrame, threshold: float, base_haircut: float
 ) -> dict[str, float | str]:
-    base_net = safe_number(
-        summary.loc[summary["Scenario"] == "Base", "Estimated net worth ($m)"].iloc[0]
-    )
-    base_gross = safe_number(
-        summary.loc[summary["Scenario"] == "Base", "Gross wealth ($m)"].iloc[0]
-    )
+    base_row = summary.loc[summary["Scenario"] == "Base"].iloc[0]
+    base_net = safe_number(base_row["Estimated net worth ($m)"])
+    base_gross = safe_number(base_row["Gross wealth ($m)"])
     event_base = safe_number(
         drivers.loc[
             drivers["Type"] == "Liquidity event", "Base current ($m)"
@@ -596,17 +642,92 @@ def editor_config() -> dict[str, Any]:
     }
 
 
+@st.cache_data(max_entries=64)
+def scenario_chart(summary: pd.DataFrame, threshold: float) -> go.Figure:
+    import plotly.express as px
+
+    fig = px.bar(
+        summary,
+        x="Scenario",
+        y="Estimated net worth ($m)",
+        text=summary["Estimated net worth ($m)"].map(money),
+        color="Scenario",
+        color_discrete_map={
+            "Low": "#64748b",
+            "Base": "#0f766e",
+            "High": "#7c3aed",
+        },
+    )
+    fig.add_hline(
+        y=threshold,
+        line_dash="dot",
+        line_color="#991b1b",
+        annotation_text=f"Threshold {money(threshold)}",
+    )
+    fig.update_layout(
+        height=350,
+        margin=dict(l=0, r=0, t=20, b=0),
+        showlegend=False,
+        yaxis_title="$m",
+        xaxis_title=None,
+    )
+    return fig
+
+
+@st.cache_data(max_entries=64)
+def driver_type_chart(drivers: pd.DataFrame) -> go.Figure:
+    import plotly.express as px
+
+    by_type = (
+        drivers.groupby("Type", dropna=False)["Base current ($m)"]
+        .sum()
+        .reset_index()
+        .sort_values("Base current ($m)", ascending=True)
+    )
+    fig = px.bar(
+        by_type,
+        x="Base current ($m)",
+        y="Type",
+        orientation="h",
+        text=by_type["Base current ($m)"].map(money),
+        color_discrete_sequence=["#1f4e78"],
+    )
+    fig.update_layout(
+        height=350,
+        margin=dict(l=0, r=0, t=20, b=0),
+        xaxis_title="$m",
+        yaxis_title=None,
+    )
+    return fig
+
+
+def sensitivity_chart(drivers: pd.DataFrame) -> go.Figure:
+    import plotly.graph_objects as go
+
+    top_sensitivity = top_sensitivity_rows(drivers)
+    fig = go.Figure(
+        go.Bar(
+            x=top_sensitivity["Sensitivity spread ($m)"],
+            y=top_sensitivity["Driver"],
+            orientation="h",
+            marker_color="#7c3aed",
+            text=top_sensitivity["Sensitivity spread ($m)"].map(money),
+        )
+    )
+    fig.update_layout(
+        height=360,
+        margin=dict(l=0, r=0, t=20, b=0),
+        xaxis_title="High minus low current value ($m)",
+        yaxis_title=None,
+    )
+    return fig
+
+
 def render_summary(
     summary: pd.DataFrame, drivers: pd.DataFrame, threshold: float, base_haircut: float
 ) -> None:
-    low, base, high = [
-        safe_number(
-            summary.loc[
-                summary["Scenario"] == scenario, "Estimated net worth ($m)"
-            ].iloc[0]
-        )
-        for scenario in SCENARIOS
-    ]
+    net_worth = summary.set_index("Scenario")["Estimated net worth ($m)"]
+    low, base, high = [safe_number(net_worth[scenario]) for scenario in SCENARIOS]
     spread = high - low
     threshold_stats = threshold_analysis(summary, drivers, threshold, base_haircut)
 
@@ -623,54 +744,11 @@ def render_summary(
 
     chart_cols = st.columns([1.15, 1])
     with chart_cols[0]:
-        fig = px.bar(
-            summary,
-            x="Scenario",
-            y="Estimated net worth ($m)",
-            text=summary["Estimated net worth ($m)"].map(money),
-            color="Scenario",
-            color_discrete_map={
-                "Low": "#64748b",
-                "Base": "#0f766e",
-                "High": "#7c3aed",
-            },
-        )
-        fig.add_hline(
-            y=threshold,
-            line_dash="dot",
-            line_color="#991b1b",
-            annotation_text=f"Threshold {money(threshold)}",
-        )
-        fig.update_layout(
-            height=350,
-            margin=dict(l=0, r=0, t=20, b=0),
-            showlegend=False,
-            yaxis_title="$m",
-            xaxis_title=None,
-        )
+        fig = scenario_chart(summary, threshold)
         st.plotly_chart(fig, use_container_width=True)
 
     with chart_cols[1]:
-        by_type = (
-            drivers.groupby("Type", dropna=False)["Base current ($m)"]
-            .sum()
-            .reset_index()
-            .sort_values("Base current ($m)", ascending=True)
-        )
-        fig = px.bar(
-            by_type,
-            x="Base current ($m)",
-            y="Type",
-            orientation="h",
-            text=by_type["Base current ($m)"].map(money),
-            color_discrete_sequence=["#1f4e78"],
-        )
-        fig.update_layout(
-            height=350,
-            margin=dict(l=0, r=0, t=20, b=0),
-            xaxis_title="$m",
-            yaxis_title=None,
-        )
+        fig = driver_type_chart(drivers)
         st.plotly_chart(fig, use_container_width=True)
 
     cols = st.columns(3)
@@ -712,22 +790,7 @@ def render_driver_tables(drivers: pd.DataFrame) -> None:
         },
     )
 
-    top_sensitivity = top_sensitivity_rows(visible)
-    fig = go.Figure(
-        go.Bar(
-            x=top_sensitivity["Sensitivity spread ($m)"],
-            y=top_sensitivity["Driver"],
-            orientation="h",
-            marker_color="#7c3aed",
-            text=top_sensitivity["Sensitivity spread ($m)"].map(money),
-        )
-    )
-    fig.update_layout(
-        height=360,
-        margin=dict(l=0, r=0, t=20, b=0),
-        xaxis_title="High minus low current value ($m)",
-        yaxis_title=None,
-    )
+    fig = sensitivity_chart(visible)
     st.plotly_chart(fig, use_container_width=True)
 
 
@@ -782,6 +845,7 @@ def main() -> None:
     )
 
     valuation_year = valuation_date.year
+    input_config = editor_config()
 
     tabs = st.tabs(
         [
@@ -800,7 +864,7 @@ def main() -> None:
             use_container_width=True,
             hide_index=True,
             num_rows="dynamic",
-            column_config=editor_config(),
+            column_config=input_config,
         )
 
     with tabs[2]:
@@ -809,7 +873,7 @@ def main() -> None:
             use_container_width=True,
             hide_index=True,
             num_rows="dynamic",
-            column_config=editor_config(),
+            column_config=input_config,
         )
 
     with tabs[3]:
@@ -818,7 +882,7 @@ def main() -> None:
             use_container_width=True,
             hide_index=True,
             num_rows="dynamic",
-            column_config=editor_config(),
+            column_config=input_config,
         )
 
     with tabs[4]:
@@ -827,7 +891,7 @@ def main() -> None:
             use_container_width=True,
             hide_index=True,
             num_rows="dynamic",
-            column_config=editor_config(),
+            column_config=input_config,
         )
 
     drivers = combine_drivers(
@@ -25,6 +25,92 @@ class AssumptionLedgerTests(unittest.TestCase):
         self.assertEqual(summary["Estimated net worth ($m)"].tolist(), [0.0, 0.0, 0.0])
         self.assertTrue(app.top_sensitivity_rows(drivers).empty)
 
+    def test_event_model_defaults_missing_inputs(self):
+        events = app.default_events().iloc[:2].copy()
+        events["Base ownership %"] = [10.0, None]
+        events["Base return multiple"] = [2.0, "unknown"]
+        drivers = app.event_model(events)
+
+        self.assertAlmostEqual(drivers["Base gross ($m)"].tolist()[0], 9.45)
+        self.assertAlmostEqual(drivers["Base current ($m)"].tolist()[0], 9.45)
+        self.assertEqual(drivers["Base gross ($m)"].tolist()[1], 0.0)
+        self.assertAlmostEqual(
+            drivers["High current ($m)"].tolist()[1], 750.0 * 0.07 * 0.6 * 13.1
+        )
+
+    def test_asset_model_and_summary_default_missing_inputs(self):
+        assets = pd.DataFrame(
+            [
+                {
+                    "Item": "Home",
+                    "Low value ($m)": 1.0,
+                    "Base value ($m)": "n/a",
+                    "High value ($m)": 3.0,
+                    "Confidence": "Confirmed",
+                    "Notes": "Appraisal",
+                },
+                {
+                    "Item": "Loan",
+                    "Low value ($m)": -2.0,
+                    "Base value ($m)": -1.5,
+                    "High value ($m)": None,
+                    "Confidence": "Speculative",
+                    "Notes": "",
+                },
+            ]
+        )
+        drivers = app.asset_model(assets)
+        expected_drivers = pd.DataFrame(
+            [
+                {
+                    "Driver": "Home",
+                    "Type": "Current asset / liability",
+                    "Source ID": "",
+                    "Confidence": "Confirmed",
+                    "Notes": "Appraisal",
+                    "Low current ($m)": 1.0,
+                    "Base current ($m)": 0.0,
+                    "High current ($m)": 3.0,
+                },
+                {
+                    "Driver": "Loan",
+                    "Type": "Current asset / liability",
+                    "Source ID": "",
+                    "Confidence": "Speculative",
+                    "Notes": "",
+                    "Low current ($m)": -2.0,
+                    "Base current ($m)": -1.5,
+                    "High current ($m)": 0.0,
+                },
+            ]
+        )
+        pd.testing.assert_frame_equal(drivers, expected_drivers)
+
+        summary = app.summarize(drivers, {"Low": 20.0, "Base": 10.0, "High": 5.0})
+        expected_summary = pd.DataFrame(
+            [
+                {
+                    "Scenario": "Low",
+                    "Gross wealth ($m)": -1.0,
+                    "Global haircut %": 20.0,
+                    "Estimated net worth ($m)": -1.0 * (1 - 0.2),
+                },
+                {
+                    "Scenario": "Base",
+                    "Gross wealth ($m)": -1.5,
+                    "Global haircut %": 10.0,
+                    "Estimated net worth ($m)": -1.5 * (1 - 0.1),
+                },
+                {
+                    "Scenario": "High",
+                    "Gross wealth ($m)": 3.0,
+                    "Global haircut %": 5.0,
+                    "Estimated net worth ($m)": 3.0 * (1 - 0.05),
+                },
+            ]
+        )
+        pd.testing.assert_frame_equal(summary, expected_summary)
+
     def test_comp_stream_ignores_future_years(self):
         row = pd.Series(
             {
@@ -43,6 +129,68 @@ class AssumptionLedgerTests(unittest.TestCase):
             app.compound_stream(future_row, "Base", valuation_year=2026), 0.0
         )
 
+    def test_comp_stream_compounds_each_contribution(self):
+        row = pd.Series(
+            {
+                "Start year": 2020,
+                "End year": 2022,
+                "Base annual gross ($m)": 10.0,
+                "Base investable %": 50.0,
+                "Base CAGR %": 10.0,
+            }
+        )
+        expected = 5.0 * (1.1**4 + 1.1**3 + 1.1**2)
+        self.assertAlmostEqual(
+            app.compound_stream(row, "Base", valuation_year=2024), expected
+        )
+
+    def test_comp_model_compounds_each_scenario(self):
+        streams = pd.DataFrame(
+            [
+                {
+                    "Stream": "Salary",
+                    "Start year": 2022,
+                    "End year": 2023,
+                    "Low annual gross ($m)": 1.0,
+                    "Base annual gross ($m)": 2.0,
+                    "High annual gross ($m)": 4.0,
+                    "Low investable %": 50.0,
+                    "Base investable %": 25.0,
+                    "High investable %": 100.0,
+                    "Low CAGR %": 0.0,
+                    "Base CAGR %": 10.0,
+                    "High CAGR %": 20.0,
+                },
+                {
+                    "Stream": "Future bonus",
+                    "Start year": 2027,
+                    "End year": 2030,
+                    "Low annual gross ($m)": 1.0,
+                    "Base annual gross ($m)": 2.0,
+                    "High annual gross ($m)": 3.0,
+                    "Low investable %": 50.0,
+                    "Base investable %": 50.0,
+                    "High investable %": 50.0,
+                    "Low CAGR %": 5.0,
+                    "Base CAGR %": 5.0,
+                    "High CAGR %": 5.0,
+                },
+            ]
+        )
+        drivers = app.comp_model(streams, valuation_year=2024)
+        current = drivers[
+            ["Low current ($m)", "Base current ($m)", "High current ($m)"]
+        ].to_numpy()
+
+        expected = [
+            0.5 * (1.0 + 1.0),
+            0.5 * (1.1**2 + 1.1),
+            4.0 * (1.2**2 + 1.2),
+        ]
+        for value, target in zip(current[0], expected):
+            self.assertAlmostEqual(value, target)
+        self.assertEqual(current[1].tolist(), [0.0, 0.0, 0.0])
+
     def test_download_json_is_strict_and_reproducible(self):
         events = app.default_events()
         events.loc[0, "Notes"] = math.nan